@@ -60,7 +60,7 @@ def main() -> None:
             print(f"WARNING: Query may have syntax issues: {analysis['warnings']}")
         
         # Search PubMed
-        logger.info(f"Searching PubMed: {args.query}")
+        logger.info("Searching PubMed: %s", args.query)
         pmids = searcher.search_pubmed(args.query, args.max_results)
         
         if not pmids:
@@ -9,7 +9,8 @@ with full type safety and error handling.
 This module can be used programmatically or via the command-line interface.
 """
 
-from .core import PubMedPharmaSearch, CompanyDataFetcher
+from typing import Any
+
 from .models import (
     ApiSource, AuthorInfo, PaperInfo, CompanyCacheData, QueryAnalysis,
     CompanyStats, SearchConfig, ApiError, QueryValidationError, CompanyDataError
@@ -33,4 +34,17 @@ __all__ = [
     "QueryValidationError", 
     "CompanyDataError",
     "get_logger"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the search classes on first access.
+    
+    The core module pulls in BioPython and requests, which commands such as
+    --help and --query-help never need.
+    """
+    if name in ("PubMedPharmaSearch", "CompanyDataFetcher"):
+        from . import core
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,16 +7,19 @@ module to search PubMed for papers with pharmaceutical/biotech company affiliati
 """
 
 import argparse
+import os
 import sys
-from typing import NoReturn, Optional
+from typing import Callable, Dict, List, NoReturn, Optional
 
-from pubmed_pharma_search import (
-    PubMedPharmaSearch,
-    ApiError,
-    CompanyDataError,
-    QueryValidationError,
-    get_logger
-)
+from pubmed_pharma_search.defaults import PAPER_CACHE_TTL_DAYS
+
+COMMANDS = ('search', 'validate-query', 'query-help', 'stats', 'update-companies', 'clean-cache')
+# Commands taking a query; the others accept no positional words
+QUERY_COMMANDS = ('search', 'validate-query')
+# Value-less options shared by every command, accepted before the command name
+COMMON_FLAGS = ('-d', '--debug', '--use-hardcoded-only')
+# Set to 1 to end successful runs with os._exit, skipping interpreter teardown
+FAST_EXIT_ENV = 'PPS_FAST_EXIT'
 
 
 def create_argument_parser() -> argparse.ArgumentParser:
@@ -63,88 +66,137 @@ Advanced Examples:
   pubmed-pharma-search "immunotherapy[mh] AND (pfizer[ad] OR moderna[ad])" -f immuno_pharma.csv
   pubmed-pharma-search '"artificial intelligence"[tiab] AND "drug discovery"[tiab] AND 2020:2025[dp]' -f ai_drugs.csv
 
+Commands:
+  search QUERY           - Search PubMed (default, the command name may be omitted
+                           unless the query is exactly a command name)
+  validate-query QUERY   - Show the query breakdown without searching
+  query-help             - Show detailed query syntax help
+  stats                  - Show company database statistics
+  update-companies       - Refresh the company database from APIs
+  clean-cache            - Clean and rebuild the company cache
+
 Complex Query Example:
   '("COVID-19"[mh] OR "COVID-19 vaccine"[tiab]) AND (pfizer[ad] OR moderna[ad]) AND "clinical trial"[pt] AND 2023:2025[dp]'
         """
     )
     
-    parser.add_argument(
+    # Options shared by every command
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        '-d', '--debug', 
+        action='store_true', 
+        help='Print debug information during execution'
+    )
+    
+    common.add_argument(
+        '--use-hardcoded-only', 
+        action='store_true',
+        help='Use only hardcoded company list (skip API fetching)'
+    )
+    
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+    
+    search_parser = subparsers.add_parser(
+        'search', 
+        parents=[common],
+        help='Search PubMed (default when no command is given)'
+    )
+    # Unquoted words are joined back into one query by parse_arguments()
+    search_parser.add_argument(
         'query', 
-        nargs='?', 
+        nargs='*', 
         help='PubMed search query (supports full PubMed syntax)'
     )
     
-    parser.add_argument(
+    search_parser.add_argument(
         '-f', '--file', 
         help='Filename to save results (if not provided, prints to console)'
     )
     
-    parser.add_argument(
-        '-d', '--debug', 
-        action='store_true', 
-        help='Print debug information during execution'
-    )
-    
-    parser.add_argument(
+    search_parser.add_argument(
         '--max-results', 
         type=int, 
         default=100,
         help='Maximum number of papers to retrieve (default: 100)'
     )
     
-    parser.add_argument(
+    search_parser.add_argument(
         '--email', 
         default='user@example.com',
         help='Email address for PubMed API (default: user@example.com)'
     )
     
-    parser.add_argument(
-        '--validate-query', 
-        action='store_true',
-        help='Validate the query syntax and show query breakdown without executing search'
+    search_parser.add_argument(
+        '--api-key', 
+        default=os.environ.get('NCBI_API_KEY'),
+        help='NCBI API key allowing 10 instead of 3 requests/second (default: $NCBI_API_KEY)'
     )
     
-    parser.add_argument(
-        '--query-help', 
+    search_parser.add_argument(
+        '--no-cache', 
         action='store_true',
-        help='Show detailed PubMed query syntax help and exit'
+        help='Fetch every paper from PubMed instead of reusing records cached by PMID'
     )
     
-    parser.add_argument(
-        '--update-companies', 
-        action='store_true',
-        help='Force update of pharmaceutical/biotech company database from APIs'
+    search_parser.add_argument(
+        '--cache-ttl-days', 
+        type=int,
+        default=PAPER_CACHE_TTL_DAYS,
+        help='Refetch cached PubMed records older than this many days (default: %(default)s)'
     )
     
-    parser.add_argument(
-        '--show-company-stats', 
-        action='store_true',
-        help='Show statistics about the company database and exit'
-    )
+    # Pre-subcommand mode flags, kept so existing invocations keep working
+    for flag in ('--validate-query', '--query-help', '--update-companies',
+                 '--show-company-stats', '--clean-company-cache'):
+        search_parser.add_argument(flag, action='store_true', help=argparse.SUPPRESS)
+    search_parser.set_defaults(handler=cmd_search)
     
-    parser.add_argument(
-        '--use-hardcoded-only', 
-        action='store_true',
-        help='Use only hardcoded company list (skip API fetching)'
+    validate_parser = subparsers.add_parser(
+        'validate-query', 
+        parents=[common],
+        help='Validate the query syntax and show query breakdown without executing search'
+    )
+    validate_parser.add_argument(
+        'query', 
+        nargs='?', 
+        help='PubMed search query to validate'
     )
+    validate_parser.set_defaults(handler=cmd_validate_query)
     
-    parser.add_argument(
-        '--clean-company-cache', 
-        action='store_true',
+    subparsers.add_parser(
+        'query-help', 
+        parents=[common],
+        help='Show detailed PubMed query syntax help and exit'
+    ).set_defaults(handler=cmd_query_help)
+    
+    subparsers.add_parser(
+        'stats', 
+        parents=[common],
+        help='Show statistics about the company database and exit'
+    ).set_defaults(handler=cmd_stats)
+    
+    subparsers.add_parser(
+        'update-companies', 
+        parents=[common],
+        help='Force update of pharmaceutical/biotech company database from APIs'
+    ).set_defaults(handler=cmd_update_companies)
+    
+    subparsers.add_parser(
+        'clean-cache', 
+        parents=[common],
         help='Clean and rebuild company cache with improved filtering'
-    )
+    ).set_defaults(handler=cmd_clean_cache)
     
     return parser
 
 
-def handle_company_stats(searcher: PubMedPharmaSearch) -> None:
+def handle_company_stats(stats: Dict) -> None:
     """
     Display company database statistics.
     
     Args:
-        searcher: PubMedPharmaSearch instance
+        stats: Company database statistics
     """
-    stats = searcher.get_company_stats()
     
     print("PHARMACEUTICAL/BIOTECH COMPANY DATABASE STATISTICS")
     print("=" * 60)
@@ -158,22 +210,23 @@ def handle_company_stats(searcher: PubMedPharmaSearch) -> None:
     for i, company in enumerate(stats['sample_companies'], 1):
         print(f"   {i:2d}. {company}")
     
-    print("Use --update-companies to refresh from APIs")
+    print("Use the update-companies command to refresh from APIs")
 
 
-def handle_query_validation(searcher: PubMedPharmaSearch, query: str) -> None:
+def handle_query_validation(query: str) -> None:
     """
     Validate and display query analysis.
     
     Args:
-        searcher: PubMedPharmaSearch instance
         query: Query string to validate
         
     Raises:
         QueryValidationError: If query validation fails
     """
+    from pubmed_pharma_search import PubMedPharmaSearch, QueryValidationError
+    
     try:
-        analysis = searcher.validate_query_syntax(query)
+        analysis = PubMedPharmaSearch.validate_query_syntax(query)
         
         print(f"\nQUERY ANALYSIS FOR: {query}\n")
         print(f"Query Status: {'VALID' if analysis['valid'] else 'INVALID'}")
@@ -210,80 +263,201 @@ def error_exit(message: str, exit_code: int = 1) -> NoReturn:
     sys.exit(exit_code)
 
 
-def main() -> None:
-    """Main entry point for the command-line interface."""
-    parser = create_argument_parser()
-    args = parser.parse_args()
+def normalize_argv(argv: List[str]) -> List[str]:
+    """
+    Put the command name first, defaulting to search when none is given.
     
-    # Set up logging
-    logger = get_logger(__name__, debug_mode=args.debug)
+    After any leading common flags, the next word is taken as a command only
+    if it names one exactly and, for commands without a query, no other
+    positional words follow. Anything else is a bare query, as accepted
+    before the subcommands existed: "--debug cancer" and "stats of aspirin"
+    both search.
     
-    try:
-        # Handle help options
-        if args.query_help:
-            searcher = PubMedPharmaSearch(debug=args.debug)
-            searcher.print_query_help()
-            return
-        
-        # Initialize searcher
-        logger.info("Initializing PubMed pharmaceutical search tool")
-        searcher = PubMedPharmaSearch(
-            email=args.email,
-            debug=args.debug,
-            use_hardcoded_only=args.use_hardcoded_only
-        )
-        
-        # Handle various operations
-        if args.clean_company_cache:
-            logger.info("Cleaning and rebuilding company cache")
-            cleaned_companies = searcher.company_fetcher.clean_and_rebuild_cache()
-            print(f"Cache rebuilt with {len(cleaned_companies)} companies")
-            return
-        
-        if args.update_companies:
-            logger.info("Updating pharmaceutical/biotech company database")
-            searcher.update_company_database()
-            stats = searcher.get_company_stats()
-            print(f"Updated! Now tracking {stats['total_companies']} companies")
-            return
-        
-        if args.show_company_stats:
-            handle_company_stats(searcher)
-            return
+    Args:
+        argv: Command-line arguments without the program name
         
-        if args.validate_query:
-            if not args.query:
-                error_exit("Query is required for validation")
-            handle_query_validation(searcher, args.query)
-            return
+    Returns:
+        Arguments starting with a command name, unless only help was requested
+    """
+    if argv and argv[0] in ('-h', '--help'):
+        return argv
+    
+    start = 0
+    while start < len(argv) and argv[start] in COMMON_FLAGS:
+        start += 1
+    if start < len(argv) and argv[start] in COMMANDS:
+        command, rest = argv[start], argv[start + 1:]
+        if command in QUERY_COMMANDS or all(arg.startswith('-') for arg in rest):
+            return [command] + argv[:start] + rest
+    return ['search'] + argv
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse the command line of any command, old or new style.
+    
+    Args:
+        argv: Command-line arguments without the program name
         
-        # Main search operation
-        if not args.query:
-            error_exit("Query is required for search. Use --help for more information.")
+    Returns:
+        Parsed arguments, with the words of a search query joined into one string
+    """
+    args = create_argument_parser().parse_args(normalize_argv(argv))
+    if args.command == 'search':
+        args.query = ' '.join(args.query) or None
+    return args
+
+
+def resolve_handler(args: argparse.Namespace) -> Callable[[argparse.Namespace], None]:
+    """
+    Pick the command handler, honouring the pre-subcommand mode flags.
+    
+    Args:
+        args: Parsed command-line arguments
         
-        logger.info(f"Starting PubMed search with query: {args.query}")
+    Returns:
+        Handler for the selected command
+    """
+    if args.command != 'search':
+        return args.handler
+    
+    # Same priority order as the flag checks of the old single-mode CLI
+    if args.clean_company_cache:
+        return cmd_clean_cache
+    if args.update_companies:
+        return cmd_update_companies
+    if args.show_company_stats:
+        return cmd_stats
+    if args.validate_query:
+        return cmd_validate_query
+    if args.query_help:
+        return cmd_query_help
+    return cmd_search
+
+
+def cmd_query_help(args: argparse.Namespace) -> None:
+    """Print the query syntax help; static text, so nothing heavy is imported."""
+    from pubmed_pharma_search.query_help import QUERY_HELP_TEXT
+    print(QUERY_HELP_TEXT)
+
+
+def cmd_validate_query(args: argparse.Namespace) -> None:
+    """Validate a query without loading the company database."""
+    if not args.query:
+        error_exit("Query is required for validation")
+    handle_query_validation(args.query)
+
+
+def cmd_stats(args: argparse.Namespace) -> None:
+    """Show company statistics, read straight from the cache database."""
+    from pubmed_pharma_search import CompanyDataFetcher, ApiSource
+    
+    fetcher = CompanyDataFetcher(debug=args.debug)
+    if args.use_hardcoded_only:
+        companies = fetcher.get_hardcoded_companies()
+        stats = {
+            "total_companies": len(companies),
+            "cache_file": fetcher.cache_file,
+            "sample_companies": list(companies)[:10],
+            "sources_used": [ApiSource.HARDCODED.value],
+            "last_updated": None
+        }
+    else:
+        stats = fetcher.get_cache_stats()
+    handle_company_stats(stats)
+
+
+def cmd_update_companies(args: argparse.Namespace) -> None:
+    """Refresh the company cache from all API sources."""
+    from pubmed_pharma_search import CompanyDataFetcher, CompanyDataError
+    
+    fetcher = CompanyDataFetcher(debug=args.debug)
+    try:
+        fetcher.fetch_all_companies(force_refresh=True)
+    except Exception as e:
+        raise CompanyDataError(f"Failed to update company database: {e}") from e
+    stats = fetcher.get_cache_stats()
+    print(f"Updated! Now tracking {stats['total_companies']} companies")
+
+
+def cmd_clean_cache(args: argparse.Namespace) -> None:
+    """Rebuild the company cache with the current filtering rules."""
+    from pubmed_pharma_search import CompanyDataFetcher
+    
+    fetcher = CompanyDataFetcher(debug=args.debug)
+    cleaned_companies = fetcher.clean_and_rebuild_cache()
+    print(f"Cache rebuilt with {len(cleaned_companies)} companies")
+
+
+def cmd_search(args: argparse.Namespace) -> None:
+    """Run the search and write results to a CSV file or the console."""
+    if not args.query:
+        error_exit("Query is required for search. Use --help for more information.")
+    
+    import itertools
+    from pubmed_pharma_search import PubMedPharmaSearch, get_logger
+    from pubmed_pharma_search.core import DEFAULT_PAPER_CACHE_FILE
+    
+    logger = get_logger(__name__, debug_mode=args.debug)
+    logger.info("Initializing PubMed pharmaceutical search tool")
+    searcher = PubMedPharmaSearch(
+        email=args.email,
+        debug=args.debug,
+        use_hardcoded_only=args.use_hardcoded_only,
+        api_key=args.api_key,
+        paper_cache_file=None if args.no_cache else DEFAULT_PAPER_CACHE_FILE,
+        paper_cache_ttl_days=args.cache_ttl_days
+    )
+    
+    try:
+        logger.info("Starting PubMed search with query: %s", args.query)
         
-        # Search PubMed
+        # Search PubMed, then stream paper details as the batches arrive
         pmids = searcher.search_pubmed(args.query, args.max_results)
         if not pmids:
             print("No papers found for the given query.")
             return
         
-        # Fetch paper details
-        papers = searcher.fetch_paper_details(pmids)
-        if not papers:
+        papers = searcher.iter_paper_details(pmids)
+        first = next(papers, None)
+        if first is None:
             print("No papers with pharmaceutical/biotech affiliations found.")
             return
+        papers = itertools.chain([first], papers)
         
         # Output results
         if args.file:
-            searcher.save_to_csv(papers, args.file)
+            count = searcher.save_to_csv(papers, args.file)
             print(f"Results saved to {args.file}")
         else:
-            searcher.print_to_console(papers)
-        
-        print(f"Found {len(papers)} papers with pharmaceutical/biotech affiliations.")
+            count = searcher.print_to_console(papers)
         
+        print(f"Found {count} papers with pharmaceutical/biotech affiliations.")
+    finally:
+        searcher.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for the command-line interface.
+    
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    """
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    
+    # Deferred until after argument parsing so --help stays fast
+    from pubmed_pharma_search import (
+        ApiError,
+        CompanyDataError,
+        QueryValidationError,
+        get_logger
+    )
+    
+    logger = get_logger(__name__, debug_mode=args.debug)
+    
+    try:
+        resolve_handler(args)(args)
     except (CompanyDataError, QueryValidationError, ApiError) as e:
         error_exit(str(e))
     except KeyboardInterrupt:
@@ -291,10 +465,18 @@ def main() -> None:
         print("\nOperation cancelled by user.")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         if args.debug:
             raise
         error_exit(f"Unexpected error occurred: {e}")
+    
+    if os.environ.get(FAST_EXIT_ENV) == '1':
+        # Freeing every cached record and company string at shutdown can take
+        # longer than the run's output; all files are closed by now, so only
+        # the standard streams need flushing
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(0)
 
 
 if __name__ == "__main__":
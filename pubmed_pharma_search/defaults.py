@@ -0,0 +1,8 @@
+"""
+Default settings shared by the search machinery and the command-line interface.
+
+This module only holds constants so that the command-line interface can show
+the defaults in its help without importing the search machinery.
+"""
+
+PAPER_CACHE_TTL_DAYS = 30
@@ -7,9 +7,33 @@ formatters and handlers for different components of the application.
 
 import logging
 import sys
+import time
 from typing import Optional
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the asctime prefix once per second instead of per record."""
+    
+    def __init__(self, fmt: Optional[str] = None) -> None:
+        super().__init__(fmt)
+        self._cached_second: Optional[int] = None
+        self._cached_prefix = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_prefix = time.strftime(self.default_time_format, self.converter(record.created))
+        return self.default_msec_format % (self._cached_prefix, record.msecs)
+
+
+# Formatters are stateless apart from the cached time prefix, so every logger shares these
+_DEBUG_FORMATTER = _CachedTimeFormatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+)
+_INFO_FORMATTER = logging.Formatter('%(levelname)s: %(message)s')
+
+
 class LoggerConfig:
     """Configuration class for application logging."""
     
@@ -42,18 +66,10 @@ class LoggerConfig:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level if not debug_mode else logging.DEBUG)
         
-        # Create formatter
-        if debug_mode:
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-            )
-        else:
-            formatter = logging.Formatter(
-                '%(levelname)s: %(message)s'
-            )
-        
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_DEBUG_FORMATTER if debug_mode else _INFO_FORMATTER)
         logger.addHandler(console_handler)
+        # The handler above already writes the record; don't format it again upstream
+        logger.propagate = False
         
         return logger
 
@@ -8,7 +8,7 @@ used throughout the application for better type safety and organization.
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Set, Union, TypedDict
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union, TypedDict
 
 
 class ApiSource(Enum):
@@ -37,28 +37,35 @@ class AuthorInfo:
     email: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class PaperInfo:
-    """Information about a research paper."""
+    """
+    Information about a research paper.
+    
+    Papers are identified by their PMID: equality and hashing look at pmid
+    only, so papers can be deduplicated with a set even though the author
+    and company fields are lists.
+    """
     pmid: str
     title: str
     publication_date: str
     non_academic_authors: List[str]
     company_affiliations: List[str]
     corresponding_author_email: Optional[str] = None
+    
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PaperInfo) and self.pmid == other.pmid
+    
+    def __hash__(self) -> int:
+        return hash(self.pmid)
 
 
-@dataclass
+@dataclass(frozen=True)
 class CompanyCacheData:
-    """Structure for cached company data."""
-    companies: Set[str]
+    """Structure for cached company data; immutable and hashable."""
+    companies: FrozenSet[str]
     last_updated: Optional[str] = None
-    sources_used: List[ApiSource] = None
-    
-    def __post_init__(self) -> None:
-        """Initialize sources_used if not provided."""
-        if self.sources_used is None:
-            self.sources_used = []
+    sources_used: Tuple[ApiSource, ...] = ()
 
 
 class QueryAnalysis(TypedDict):
@@ -84,6 +91,7 @@ class SearchConfig(TypedDict, total=False):
     debug: bool
     max_results: int
     use_hardcoded_only: bool
+    api_key: str
 
 
 class ApiError(Exception):
@@ -0,0 +1,111 @@
+"""
+PubMed query syntax reference for the PubMed pharmaceutical search tool.
+
+This module only holds static text so that the command-line interface can
+print query help without importing the search machinery.
+"""
+
+QUERY_HELP_TEXT = """
+COMPLETE PUBMED QUERY SYNTAX GUIDE
+
+1. BOOLEAN OPERATORS (case-insensitive but uppercase recommended):
+   AND  - Both terms must be present
+   OR   - Either term can be present  
+   NOT  - Exclude the following term
+   
+   Examples:
+   cancer AND chemotherapy
+   (aspirin OR ibuprofen) AND headache
+   diabetes NOT "type 1"
+
+2. FIELD TAGS - Target specific parts of articles:
+   [ti] or [Title]        - Article title only
+   [tiab]                 - Title and abstract
+   [au] or [Author]       - Author names
+   [ta] or [Journal]      - Journal title
+   [ad] or [Affiliation]  - Author affiliation
+   [mh] or [MeSH]         - Medical Subject Headings
+   [dp] or [Date]         - Publication date
+   [pt] or [Publication Type] - Article type (review, clinical trial, etc.)
+   [la] or [Language]     - Publication language
+   [so] or [Source]       - Journal citation info
+   
+   Examples:
+   "gene therapy"[ti]                    - "gene therapy" in title
+   smith ja[au]                          - Author named "Smith JA"
+   nature[ta]                            - Published in Nature journal
+   pfizer[ad]                            - Author affiliated with Pfizer
+   COVID-19[mh]                          - MeSH term for COVID-19
+
+3. DATE FILTERING:
+   YYYY/MM/DD[dp]                        - Exact date
+   YYYY/MM/DD:YYYY/MM/DD[dp]             - Date range
+   YYYY:YYYY[dp]                         - Year range
+   last N days[dp]                       - Last N days
+   last N months[dp]                     - Last N months
+   
+   Examples:
+   2023/05/12[dp]                        - May 12, 2023
+   2020/01/01:2023/12/31[dp]             - 2020 to 2023
+   2018:2023[dp]                         - Years 2018-2023
+   last 6 months[dp]                     - Last 6 months
+
+4. PHRASES AND WILDCARDS:
+   "exact phrase"                        - Search for exact phrase
+   word*                                 - Wildcard (word, words, wordy, etc.)
+   
+   Examples:
+   "stem cell therapy"                   - Exact phrase
+   therap*                               - therapy, therapies, therapeutic, etc.
+
+5. MESH TERMS (Medical Subject Headings):
+   term[mh]                              - Standard MeSH term
+   term[mh:noexp]                        - Don't include subheadings
+   
+   Examples:
+   "Neoplasms"[mh]                       - Cancer MeSH term
+   "Drug Therapy"[mh]                    - Drug treatment MeSH
+
+6. PUBLICATION TYPES:
+   "Clinical Trial"[pt]                  - Clinical trials
+   "Review"[pt]                          - Review articles
+   "Meta-Analysis"[pt]                   - Meta-analyses
+   "Case Reports"[pt]                    - Case reports
+   
+7. COMPLEX QUERY CONSTRUCTION:
+   Use parentheses to group terms and control logic order
+   Combine multiple field tags and operators
+   
+   Example Complex Queries:
+   
+   a) COVID-19 vaccine trials from pharma companies:
+   ("COVID-19"[mh] OR "SARS-CoV-2"[mh]) AND vaccine[ti] AND (pfizer[ad] OR moderna[ad] OR "johnson & johnson"[ad]) AND "clinical trial"[pt]
+   
+   b) Recent AI in drug discovery:
+   ("artificial intelligence"[tiab] OR "machine learning"[tiab]) AND "drug discovery"[tiab] AND 2020:2025[dp]
+   
+   c) Cancer immunotherapy with pharma involvement:
+   (cancer[mh] OR tumor[tiab]) AND immunotherapy[tiab] AND (pharma*[ad] OR biotech*[ad]) AND last 5 years[dp]
+
+8. TIPS FOR EFFECTIVE SEARCHING:
+   - Use quotes for exact phrases
+   - Combine broad and specific terms
+   - Use field tags to focus searches
+   - Include date ranges for recent research
+   - Use wildcards for variant spellings
+   - Check MeSH database for standard terms
+   - Start broad, then narrow with additional terms
+
+9. SPECIAL CHARACTERS:
+   - Use quotes around phrases with spaces
+   - Escape special characters if needed
+   - Be careful with punctuation in company names
+
+10. EXAMPLE COMMANDS:
+    python pubmed_pharma_search.py "cancer drug discovery"
+    python pubmed_pharma_search.py "CRISPR therapeutics" -f results.csv -d
+    python pubmed_pharma_search.py "COVID-19[MeSH] AND vaccine" -f covid_pharma.csv
+    python pubmed_pharma_search.py "(cancer[ti] OR tumor[ti]) AND drug discovery[tiab]" -f cancer_drugs.csv
+
+For more information, visit: https://pubmed.ncbi.nlm.nih.gov/help/
+        """
@@ -0,0 +1,59 @@
+"""Shared fixtures for the pubmed_pharma_search test suite."""
+
+import io
+from typing import Callable, Dict, List
+
+import pytest
+
+from pubmed_pharma_search import core
+
+from pubmed_xml import efetch_xml
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep every cache file of a test in its own temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(core, "USER_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(core, "MATCHER_CACHE_FILE", str(tmp_path / "company_matcher.pkl"))
+    return tmp_path
+
+
+@pytest.fixture
+def efetch_calls() -> List[Dict]:
+    """Parameters of the EFetch calls made by the fake_efetch searchers."""
+    return []
+
+
+@pytest.fixture
+def make_searcher(efetch_calls) -> Callable[..., core.PubMedPharmaSearch]:
+    """
+    Build searchers whose EFetch calls are answered locally from efetch_xml.
+    
+    Every searcher built is closed when the test ends.
+    """
+    searchers = []
+    
+    def fake_efetch(**params):
+        efetch_calls.append(params)
+        return io.BytesIO(efetch_xml(params["id"].split(",")))
+    
+    def factory(**kwargs) -> core.PubMedPharmaSearch:
+        kwargs.setdefault("paper_cache_file", None)
+        searcher = core.PubMedPharmaSearch(**kwargs)
+        searcher._efetch = fake_efetch
+        searchers.append(searcher)
+        return searcher
+    
+    yield factory
+    for searcher in searchers:
+        searcher.close()
+
+
+@pytest.fixture
+def company_cache(isolated_cache_dir) -> str:
+    """Seed a fresh company cache at the default path, so no company API is queried."""
+    fetcher = core.CompanyDataFetcher()
+    fetcher._save_cache(core.HARDCODED_COMPANIES, [core.ApiSource.HARDCODED])
+    fetcher.close()
+    return str(isolated_cache_dir / core.DEFAULT_CACHE_FILE)
@@ -0,0 +1,47 @@
+"""Builders for the PubMed E-utilities XML documents used as test input."""
+
+from typing import List
+
+
+EFETCH_HEADER = (
+    '<?xml version="1.0" ?>\n'
+    '<!DOCTYPE PubmedArticleSet PUBLIC "-//NLM//DTD PubMedArticle, 1st January 2024//EN" '
+    '"https://dtd.nlm.nih.gov/ncbi/pubmed/out/pubmed_240101.dtd">\n'
+)
+
+# Indexed by PMID modulo the list length
+AFFILIATIONS = [
+    ["Department of Biology, Harvard University, Boston, MA.",
+     "Pfizer Inc., New York, NY, USA. john@pfizer.com"],
+    ["Stanford University, CA."],
+    ["Genentech, Inc., South San Francisco, CA 94080, USA.",
+     "Roche Pharma Research and Early Development, Basel."],
+    ["Moderna Therapeutics, Cambridge MA. x@y.org"],
+]
+
+
+def article_xml(pmid: str, affiliations: List[str]) -> str:
+    """Build one PubmedArticle element with an author per affiliation."""
+    authors = "".join(
+        f"<Author><LastName>L{i}</LastName><ForeName>F{i}</ForeName>"
+        f"<AffiliationInfo><Affiliation>{affiliation}</Affiliation></AffiliationInfo></Author>"
+        for i, affiliation in enumerate(affiliations)
+    )
+    return (
+        f"<PubmedArticle><MedlineCitation Status='MEDLINE' Owner='NLM'>"
+        f"<PMID Version='1'>{pmid}</PMID><Article PubModel='Print'>"
+        f"<Journal><JournalIssue CitedMedium='Print'><PubDate>"
+        f"<Year>2023</Year><Month>May</Month><Day>4</Day>"
+        f"</PubDate></JournalIssue></Journal>"
+        f"<ArticleTitle>Title\n  of <i>{pmid}</i></ArticleTitle>"
+        f"<AuthorList CompleteYN='Y'>{authors}</AuthorList>"
+        f"</Article></MedlineCitation></PubmedArticle>"
+    )
+
+
+def efetch_xml(pmids: List[str]) -> bytes:
+    """Build an EFetch response for the PMIDs, with affiliations from AFFILIATIONS."""
+    articles = "".join(
+        article_xml(pmid, AFFILIATIONS[int(pmid) % len(AFFILIATIONS)]) for pmid in pmids
+    )
+    return (EFETCH_HEADER + "<PubmedArticleSet>" + articles + "</PubmedArticleSet>").encode("utf-8")
@@ -0,0 +1,143 @@
+"""Tests for the SQLite company cache and PMID paper cache."""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from pubmed_pharma_search import core
+from pubmed_pharma_search.core import ApiSource, CompanyDataFetcher
+
+
+PMIDS = [str(pmid) for pmid in range(1, 13)]
+
+
+@pytest.fixture
+def no_company_apis(monkeypatch):
+    """Fail the test if any company API would be queried."""
+    def unexpected_fetch(self):
+        raise AssertionError("company API queried")
+    
+    for name in ("fetch_from_clinicaltrials_gov", "fetch_from_openfda", "fetch_from_wikidata"):
+        monkeypatch.setattr(CompanyDataFetcher, name, unexpected_fetch)
+
+
+def test_company_cache_round_trip():
+    companies = frozenset({"pfizer", "acme biotech", "genentech"})
+    sources = {"pfizer": ApiSource.HARDCODED, "acme biotech": ApiSource.WIKIDATA}
+    
+    writer = CompanyDataFetcher()
+    writer._save_cache(companies, [ApiSource.HARDCODED, ApiSource.WIKIDATA], sources)
+    writer.close()
+    
+    reader = CompanyDataFetcher()
+    cached = reader._load_cache()
+    stats = reader.get_cache_stats()
+    
+    assert cached.companies == companies
+    assert cached.sources_used == (ApiSource.HARDCODED, ApiSource.WIKIDATA)
+    assert reader._is_cache_valid(cached.last_updated)
+    assert reader.contains("acme biotech") and not reader.contains("acme")
+    assert stats["total_companies"] == 3
+    assert stats["sources_used"] == ["hardcoded", "wikidata.org"]
+    reader.close()
+
+
+def test_fresh_company_cache_is_used(no_company_apis):
+    writer = CompanyDataFetcher()
+    writer._save_cache(frozenset({"pfizer"}), [ApiSource.HARDCODED])
+    writer.close()
+    
+    fetcher = CompanyDataFetcher()
+    
+    assert fetcher.fetch_all_companies() == frozenset({"pfizer"})
+    fetcher.close()
+
+
+def test_expired_company_cache_is_refreshed(monkeypatch):
+    expired = (datetime.now() - timedelta(days=core.CACHE_EXPIRY_DAYS + 1)).isoformat()
+    writer = CompanyDataFetcher()
+    writer._save_cache(frozenset({"stale pharma"}), [ApiSource.HARDCODED], last_updated=expired)
+    writer.close()
+    
+    monkeypatch.setattr(CompanyDataFetcher, "fetch_from_clinicaltrials_gov", lambda self: {"acme biotech"})
+    monkeypatch.setattr(CompanyDataFetcher, "fetch_from_openfda", lambda self: {"pfizer"})
+    
+    def failing_fetch(self):
+        raise core.ApiError("unavailable", ApiSource.WIKIDATA)
+    
+    monkeypatch.setattr(CompanyDataFetcher, "fetch_from_wikidata", failing_fetch)
+    
+    fetcher = CompanyDataFetcher()
+    assert fetcher._load_cache(skip_expired=True).companies == frozenset()
+    
+    companies = fetcher.fetch_all_companies()
+    cached = fetcher._load_cache()
+    
+    assert "acme biotech" in companies and "stale pharma" not in companies
+    assert {company.lower() for company in core.HARDCODED_COMPANIES} <= companies
+    assert cached.companies == companies
+    assert cached.sources_used == (ApiSource.HARDCODED, ApiSource.CLINICAL_TRIALS, ApiSource.OPENFDA)
+    fetcher.close()
+
+
+def test_legacy_json_cache_is_imported(no_company_apis):
+    last_updated = datetime.now().isoformat()
+    with open("pharma_companies_cache.json", "w") as f:
+        json.dump({"companies": ["pfizer", "moderna"], "sources_used": ["hardcoded"],
+                   "last_updated": last_updated}, f)
+    
+    fetcher = CompanyDataFetcher()
+    cached = fetcher._load_cache()
+    
+    assert cached.companies == frozenset({"pfizer", "moderna"})
+    assert cached.last_updated == last_updated
+    assert fetcher.fetch_all_companies() == frozenset({"pfizer", "moderna"})
+    fetcher.close()
+
+
+def test_paper_cache_round_trip(make_searcher, efetch_calls, tmp_path):
+    cache_file = str(tmp_path / "papers.db")
+    uncached = make_searcher(use_hardcoded_only=True).fetch_paper_details(PMIDS)
+    efetch_calls.clear()
+    
+    first = make_searcher(use_hardcoded_only=True, paper_cache_file=cache_file)
+    assert first.fetch_paper_details(PMIDS[:6]) == uncached[:4]
+    assert len(efetch_calls) == 1
+    assert first.fetch_paper_details(PMIDS) == uncached
+    assert efetch_calls[1]["id"].split(",") == PMIDS[6:]
+    first.close()
+    
+    second = make_searcher(use_hardcoded_only=True, paper_cache_file=cache_file)
+    
+    assert list(second.iter_paper_details(PMIDS)) == uncached
+    assert len(efetch_calls) == 2
+
+
+def test_paper_cache_ttl(make_searcher, efetch_calls, tmp_path, monkeypatch):
+    cache_file = str(tmp_path / "papers.db")
+    make_searcher(use_hardcoded_only=True, paper_cache_file=cache_file).fetch_paper_details(PMIDS)
+    
+    fetched_at = time.time()
+    monkeypatch.setattr(core.time, "time", lambda: fetched_at + 2 * 86400)
+    
+    fresh = make_searcher(use_hardcoded_only=True, paper_cache_file=cache_file, paper_cache_ttl_days=3)
+    fresh.fetch_paper_details(PMIDS)
+    assert len(efetch_calls) == 1
+    
+    expired = make_searcher(use_hardcoded_only=True, paper_cache_file=cache_file, paper_cache_ttl_days=1)
+    expired.fetch_paper_details(PMIDS)
+    assert len(efetch_calls) == 2
+    assert efetch_calls[1]["id"].split(",") == PMIDS
+
+
+def test_unreadable_paper_cache_entry_is_refetched(make_searcher, efetch_calls, tmp_path):
+    cache_file = str(tmp_path / "papers.db")
+    searcher = make_searcher(use_hardcoded_only=True, paper_cache_file=cache_file)
+    expected = searcher.fetch_paper_details(PMIDS)
+    with searcher._connect_paper_cache() as db:
+        db.execute("UPDATE papers SET fields = ? WHERE pmid = ?", (b"{not json", "4"))
+    
+    assert searcher.fetch_paper_details(PMIDS) == expected
+    assert efetch_calls[-1]["id"] == "4"
@@ -0,0 +1,67 @@
+"""Tests for the command-line argument handling."""
+
+import pytest
+
+from pubmed_pharma_search import cli, core
+
+
+@pytest.mark.parametrize("argv, command, query", [
+    (["cancer"], "search", "cancer"),
+    (["--debug", "cancer"], "search", "cancer"),
+    (["cancer", "-f", "out.csv"], "search", "cancer"),
+    (["-f", "out.csv", "--max-results", "5", "cancer"], "search", "cancer"),
+    (["stats", "of", "aspirin"], "search", "stats of aspirin"),
+    (["stats of aspirin"], "search", "stats of aspirin"),
+    (["search", "stats"], "search", "stats"),
+    (["--debug", "search", "cancer"], "search", "cancer"),
+    (["validate-query", "cancer AND drug"], "validate-query", "cancer AND drug"),
+    (["-d", "validate-query", "cancer"], "validate-query", "cancer"),
+    (["stats"], "stats", None),
+    (["--use-hardcoded-only", "stats"], "stats", None),
+    (["query-help", "-d"], "query-help", None),
+])
+def test_commands_and_bare_queries(argv, command, query):
+    args = cli.parse_arguments(argv)
+    
+    assert args.command == command
+    assert getattr(args, "query", None) == query
+
+
+@pytest.mark.parametrize("argv, handler", [
+    (["cancer"], cli.cmd_search),
+    (["stats", "of", "aspirin"], cli.cmd_search),
+    (["stats"], cli.cmd_stats),
+    (["-d", "stats"], cli.cmd_stats),
+    (["validate-query", "cancer"], cli.cmd_validate_query),
+    (["query-help"], cli.cmd_query_help),
+    (["update-companies"], cli.cmd_update_companies),
+    (["clean-cache"], cli.cmd_clean_cache),
+    # Pre-subcommand mode flags
+    (["--validate-query", "cancer"], cli.cmd_validate_query),
+    (["cancer", "--validate-query"], cli.cmd_validate_query),
+    (["--query-help"], cli.cmd_query_help),
+    (["--show-company-stats"], cli.cmd_stats),
+    (["--use-hardcoded-only", "--show-company-stats"], cli.cmd_stats),
+    (["--update-companies"], cli.cmd_update_companies),
+    (["--clean-company-cache"], cli.cmd_clean_cache),
+    (["--clean-company-cache", "--update-companies"], cli.cmd_clean_cache),
+    (["--update-companies", "--show-company-stats"], cli.cmd_update_companies),
+])
+def test_resolve_handler(argv, handler):
+    assert cli.resolve_handler(cli.parse_arguments(argv)) is handler
+
+
+def test_legacy_flags_keep_their_options():
+    args = cli.parse_arguments(["--debug", "--use-hardcoded-only", "-f", "out.csv", "cancer"])
+    
+    assert args.debug and args.use_hardcoded_only
+    assert args.file == "out.csv"
+    assert args.query == "cancer"
+
+
+def test_help_is_left_to_the_top_level_parser():
+    assert cli.normalize_argv(["--help"]) == ["--help"]
+
+
+def test_cache_ttl_default_matches_core():
+    assert cli.parse_arguments(["cancer"]).cache_ttl_days == core.PAPER_CACHE_TTL_DAYS
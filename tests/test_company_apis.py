@@ -0,0 +1,82 @@
+"""Tests for the company API fetchers, answered by a local fake session."""
+
+import io
+import json
+
+import pytest
+import requests
+from urllib3.response import HTTPResponse
+
+from pubmed_pharma_search import core
+from pubmed_pharma_search.core import CompanyDataFetcher
+
+
+class FakeSession:
+    """Stand-in for requests.Session answering GETs with canned pages, JSON-encoded unless bytes."""
+    
+    def __init__(self, pages):
+        self.pages = pages
+        self.params = []
+    
+    def get(self, url, params=None, **kwargs):
+        # Copied, as the fetcher updates the same dict for the next page
+        self.params.append(dict(params or {}))
+        page = self.pages[min(len(self.params), len(self.pages)) - 1]
+        body = page if isinstance(page, bytes) else json.dumps(page).encode("utf-8")
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.raw = HTTPResponse(
+            body=io.BytesIO(body), status=200, preload_content=False
+        )
+        return response
+    
+    def close(self):
+        pass
+
+
+def _study(lead_sponsor, *collaborators):
+    return {'protocolSection': {'sponsorCollaboratorsModule': {
+        'leadSponsor': {'name': lead_sponsor},
+        'collaborators': [{'name': name} for name in collaborators]
+    }}}
+
+
+@pytest.fixture(params=["ijson", "json"])
+def fetcher(request, monkeypatch):
+    """Company fetcher parsing responses incrementally with ijson, or all at once."""
+    if request.param == "ijson" and core.ijson is None:
+        pytest.skip("ijson is not installed")
+    if request.param == "json":
+        monkeypatch.setattr(core, "ijson", None)
+    fetcher = CompanyDataFetcher()
+    yield fetcher
+    fetcher.close()
+
+
+def test_clinical_trials_pages_are_followed(fetcher):
+    fetcher._session = FakeSession([
+        {'totalCount': 3, 'nextPageToken': "page2",
+         'studies': [_study("Acme Biotech Inc", "Harvard University"), _study("Pfizer")]},
+        {'studies': [_study("University of Oxford", "Zeta Pharmaceuticals")]},
+    ])
+    
+    companies = fetcher.fetch_from_clinicaltrials_gov()
+    
+    assert companies == {"acme biotech inc", "pfizer", "zeta pharmaceuticals"}
+    assert [params.get('pageToken') for params in fetcher._session.params] == [None, "page2"]
+    assert fetcher._session.params[0]['pageSize'] == core.CLINICAL_TRIALS_PAGE_SIZE
+
+
+def test_clinical_trials_paging_is_bounded(fetcher):
+    fetcher._session = FakeSession([{'nextPageToken': "more", 'studies': [_study("Acme Biotech Inc")]}])
+    
+    assert fetcher.fetch_from_clinicaltrials_gov() == {"acme biotech inc"}
+    assert len(fetcher._session.params) == core.CLINICAL_TRIALS_MAX_PAGES
+
+
+def test_clinical_trials_invalid_json_raises_api_error(fetcher):
+    fetcher._session = FakeSession([b'{"studies": [{'])
+    
+    with pytest.raises(core.ApiError):
+        fetcher.fetch_from_clinicaltrials_gov()
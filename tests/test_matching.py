@@ -0,0 +1,68 @@
+"""Tests for company matching across the optional matcher backends."""
+
+import pytest
+
+from pubmed_pharma_search import core
+
+
+AFFILIATIONS = [
+    "Pfizer Inc., New York, NY, USA.",
+    "Department of Biology, Harvard University, Boston, MA.",
+    "Genentech, Inc., South San Francisco, CA 94080, USA.",
+    "Roche Pharma Research and Early Development, Basel.",
+    "Novartis-sponsored trial unit, Basel, Switzerland.",
+    "Former employee of Biogenentech Holdings, Zurich.",
+    "Non-Pfizer affiliated site, Dublin.",
+    "AstraZenecaAB research campus, Gothenburg.",
+    "Stanford University, CA.",
+    "",
+]
+
+BACKENDS = ["automaton", "trie", "substring"]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend_searcher(request, make_searcher, monkeypatch):
+    """Searcher on the hardcoded companies, matching with one backend."""
+    if request.param == "automaton" and core.ahocorasick is None:
+        pytest.skip("pyahocorasick is not installed")
+    if request.param == "trie" and core.marisa_trie is None:
+        pytest.skip("marisa-trie is not installed")
+    if request.param != "automaton":
+        monkeypatch.setattr(core, "ahocorasick", None)
+    if request.param == "substring":
+        monkeypatch.setattr(core, "marisa_trie", None)
+    
+    searcher = make_searcher(use_hardcoded_only=True)
+    assert (searcher._automaton is not None) == (request.param == "automaton")
+    assert (searcher._company_trie is not None) == (request.param == "trie")
+    return searcher
+
+
+def _substring_matches(affiliation):
+    text = affiliation.lower()
+    return {company for company in core.HARDCODED_COMPANIES if company in text}
+
+
+@pytest.mark.parametrize("affiliation", AFFILIATIONS)
+def test_backends_match_the_same_companies(backend_searcher, affiliation):
+    text = affiliation.lower()
+    expected = _substring_matches(affiliation)
+    
+    assert backend_searcher._match_companies(text) == expected
+    assert backend_searcher._mentions_any_company([affiliation]) == bool(expected)
+
+
+@pytest.mark.parametrize("affiliation", AFFILIATIONS)
+def test_backends_classify_the_same_way(backend_searcher, make_searcher, monkeypatch, affiliation):
+    monkeypatch.setattr(core, "ahocorasick", None)
+    monkeypatch.setattr(core, "marisa_trie", None)
+    reference = make_searcher(use_hardcoded_only=True)
+    
+    expected = reference._is_pharma_biotech_affiliation(affiliation)
+    
+    assert backend_searcher._is_pharma_biotech_affiliation(affiliation) == expected
+
+
+def test_matches_do_not_span_affiliations(backend_searcher):
+    assert not backend_searcher._mentions_any_company(["Clinic of Pfi", "zer Street"])
@@ -0,0 +1,151 @@
+"""Tests for EFetch and ESearch parsing with the lxml and standard library backends."""
+
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from pubmed_pharma_search import core
+
+from pubmed_xml import EFETCH_HEADER, article_xml, efetch_xml
+
+
+LXML_ETREE = core.xml_etree if core.xml_etree is not ET else None
+
+
+@pytest.fixture(params=["lxml", "etree"])
+def xml_backend(request, monkeypatch):
+    """Parse with lxml or with xml.etree.ElementTree."""
+    if request.param == "lxml":
+        if LXML_ETREE is None:
+            pytest.skip("lxml is not installed")
+        monkeypatch.setattr(core, "xml_etree", LXML_ETREE)
+    else:
+        monkeypatch.setattr(core, "xml_etree", ET)
+    return request.param
+
+
+@pytest.fixture
+def searcher(xml_backend, make_searcher):
+    return make_searcher(use_hardcoded_only=True)
+
+
+def _efetch_document(*articles):
+    return (EFETCH_HEADER + "<PubmedArticleSet>" + "".join(articles) + "</PubmedArticleSet>").encode("utf-8")
+
+
+def test_articles_are_streamed_in_order(searcher):
+    records = searcher._iter_pubmed_articles(efetch_xml(["3", "1", "2"]))
+    
+    assert [record.findtext("MedlineCitation/PMID") for record in records] == ["3", "1", "2"]
+
+
+def test_record_fields(searcher):
+    record = next(searcher._iter_pubmed_articles(efetch_xml(["4"])))
+    
+    assert searcher._extract_record_fields(record) == {
+        'pmid': "4",
+        'title': "Title\n  of 4",
+        'publication_date': "2023-May-4",
+        'authors': [
+            {'name': "F0 L0", 'affiliation': "Department of Biology, Harvard University, Boston, MA."},
+            {'name': "F1 L1", 'affiliation': "Pfizer Inc., New York, NY, USA. john@pfizer.com"},
+        ]
+    }
+
+
+def test_parse_batch_keeps_papers_with_company_authors(searcher):
+    papers = searcher._parse_batch(efetch_xml(["1", "2", "3", "4"]))
+    
+    assert papers == [
+        {
+            'pmid': "2",
+            'title': "Title of 2",
+            'publication_date': "2023-May-4",
+            'non_academic_authors': "F0 L0; F1 L1",
+            'company_affiliations': "Genentech, Inc., South San; Roche Pharma Research and Early",
+            'corresponding_author_email': ""
+        },
+        {
+            'pmid': "3",
+            'title': "Title of 3",
+            'publication_date': "2023-May-4",
+            'non_academic_authors': "F0 L0",
+            'company_affiliations': "Moderna Therapeutics, Cambridge MA",
+            'corresponding_author_email': "x@y.org"
+        },
+        {
+            'pmid': "4",
+            'title': "Title of 4",
+            'publication_date': "2023-May-4",
+            'non_academic_authors': "F1 L1",
+            'company_affiliations': "Pfizer Inc., New York",
+            'corresponding_author_email': "john@pfizer.com"
+        },
+    ]
+
+
+def test_cached_fields_build_the_same_papers(searcher):
+    data = efetch_xml([str(pmid) for pmid in range(1, 9)])
+    
+    from_fields = [searcher._paper_from_fields(fields) for fields in searcher._extract_batch_fields(data)]
+    
+    assert [paper for paper in from_fields if paper] == searcher._parse_batch(data)
+
+
+def test_author_names_and_affiliations(searcher):
+    article = (
+        "<PubmedArticle><MedlineCitation><PMID>9</PMID><Article>"
+        "<ArticleTitle>T</ArticleTitle><AuthorList>"
+        "<Author><LastName>Solo</LastName>"
+        "<AffiliationInfo><Affiliation>  Pfizer\n  Inc.,   Groton </Affiliation></AffiliationInfo>"
+        "<AffiliationInfo><Affiliation>Yale University</Affiliation></AffiliationInfo></Author>"
+        "<Author><CollectiveName>The <i>Study</i> Group</CollectiveName></Author>"
+        "<Author><AffiliationInfo><Affiliation>Nameless</Affiliation></AffiliationInfo></Author>"
+        "</AuthorList></Article></MedlineCitation></PubmedArticle>"
+    )
+    record = next(searcher._iter_pubmed_articles(_efetch_document(article)))
+    
+    assert searcher._extract_author_info(record.find("MedlineCitation/Article")) == [
+        {'name': "Solo", 'affiliation': "Pfizer Inc., Groton; Yale University"},
+        {'name': "The Study Group", 'affiliation': ""},
+    ]
+
+
+def test_publication_date_falls_back_to_article_date(searcher):
+    article = (
+        "<PubmedArticle><MedlineCitation><PMID>10</PMID><Article>"
+        "<Journal><JournalIssue><PubDate><MedlineDate>2021 Spring</MedlineDate></PubDate></JournalIssue></Journal>"
+        "<ArticleTitle>T</ArticleTitle>"
+        "<ArticleDate DateType='Electronic'><Year>2021</Year><Month>3</Month><Day>7</Day></ArticleDate>"
+        "</Article></MedlineCitation></PubmedArticle>"
+    )
+    record = next(searcher._iter_pubmed_articles(_efetch_document(article)))
+    
+    assert searcher._extract_publication_date(record.find("MedlineCitation/Article")) == "2021-03-07"
+
+
+def test_malformed_records_are_skipped(searcher):
+    broken = "<PubmedArticle><MedlineCitation><PMID>5</PMID></MedlineCitation></PubmedArticle>"
+    data = _efetch_document(article_xml("4", ["Pfizer Inc."]), broken, article_xml("8", ["Pfizer Inc."]))
+    
+    assert [paper['pmid'] for paper in searcher._parse_batch(data)] == ["4", "8"]
+    assert [fields['pmid'] for fields in searcher._extract_batch_fields(data)] == ["4", "8"]
+
+
+def test_truncated_response_keeps_complete_records(searcher):
+    data = efetch_xml(["2", "3", "4"])
+    
+    papers = searcher._parse_batch(data[:data.rindex(b"<PubmedArticle>") + 40])
+    
+    assert [paper['pmid'] for paper in papers] == ["2", "3"]
+
+
+def test_esearch_ids(xml_backend):
+    data = b"<eSearchResult><Count>2</Count><IdList><Id>31</Id><Id>7</Id></IdList></eSearchResult>"
+    
+    assert core._parse_esearch_ids(data) == ["31", "7"]
+
+
+def test_esearch_error(xml_backend):
+    with pytest.raises(RuntimeError, match="Invalid query"):
+        core._parse_esearch_ids(b"<eSearchResult><ERROR>Invalid query</ERROR></eSearchResult>")
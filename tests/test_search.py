@@ -0,0 +1,71 @@
+"""Tests for the batch fetch pipeline of PubMedPharmaSearch."""
+
+import asyncio
+
+import pytest
+
+from pubmed_pharma_search import CompanyDataError, CompanyDataFetcher
+
+
+PMIDS = [str(pmid) for pmid in range(1, 1201)]
+
+
+@pytest.mark.parametrize("method", ["fetch_paper_details", "iter_paper_details"])
+def test_no_cache_search_closes_cleanly(make_searcher, company_cache, method):
+    searcher = make_searcher()
+    
+    papers = list(getattr(searcher, method)(PMIDS))
+    
+    assert [paper['pmid'] for paper in papers] == [p for p in PMIDS if int(p) % 4 != 1]
+    searcher.close()
+
+
+def test_company_set_is_loaded_once(make_searcher, company_cache, monkeypatch):
+    searcher = make_searcher()
+    fetch_all = CompanyDataFetcher.fetch_all_companies
+    calls = []
+    
+    def counting_fetch_all(self, *args, **kwargs):
+        calls.append(args)
+        return fetch_all(self, *args, **kwargs)
+    
+    monkeypatch.setattr(CompanyDataFetcher, "fetch_all_companies", counting_fetch_all)
+    
+    assert searcher.fetch_paper_details(PMIDS)
+    assert len(calls) == 1
+
+
+def test_company_data_errors_propagate(make_searcher, monkeypatch):
+    searcher = make_searcher()
+    
+    def failing_fetch_all(self, *args, **kwargs):
+        raise CompanyDataError("cache unreadable")
+    
+    monkeypatch.setattr(CompanyDataFetcher, "fetch_all_companies", failing_fetch_all)
+    
+    with pytest.raises(CompanyDataError):
+        searcher.fetch_paper_details(PMIDS)
+    with pytest.raises(CompanyDataError):
+        list(searcher.iter_paper_details(PMIDS))
+
+
+def test_aiter_paper_details_cancels_pending_batches(make_searcher, company_cache):
+    searcher = make_searcher()
+    
+    async def first_paper_then_stop():
+        papers = searcher.aiter_paper_details(PMIDS)
+        paper = await papers.__anext__()
+        await papers.aclose()
+        return paper, asyncio.all_tasks() - {asyncio.current_task()}
+    
+    paper, pending = asyncio.run(first_paper_then_stop())
+    
+    assert paper['pmid'] == '2'
+    assert not pending
+
+
+def test_iter_paper_details_can_stop_early(make_searcher, company_cache):
+    papers = make_searcher().iter_paper_details(PMIDS)
+    
+    assert next(papers)['pmid'] == '2'
+    papers.close()